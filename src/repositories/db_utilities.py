@@ -1,6 +1,7 @@
 from pathlib import Path
 import json
 from repositories.trie import trie as default_trie
+from repositories.deletion_index import deletion_index as default_deletion_index
 
 
 class EnglishDictionary:
@@ -9,15 +10,18 @@ class EnglishDictionary:
         English words and their frequencies.
     """
 
-    def __init__(self, trie=default_trie):
+    def __init__(self, trie=default_trie, deletion_index=default_deletion_index):
         """Method initiatilizes the English dictionary by calling
         the key methods in the class.
 
         Args:
             trie (Class, optional): Class for the trie data structure.
             Defaults to default_trie.
+            deletion_index (Class, optional): Class for the deletion index of
+            the dictionary words. Defaults to default_deletion_index.
         """
         self.trie = trie
+        self.deletion_index = deletion_index
         self.words_in_original_dictionary = 0
         self.frequencies_in_original_dictionary = 0
         self.words_in_trie = 0
@@ -35,9 +39,9 @@ class EnglishDictionary:
         return file_location
 
     def _populate_trie_based_on_file(self):
-        """Method populates trie with the words and their frequencies from
-        the English dictionary that only contain English alphabets
-        e.g. words with numbers are excluded.
+        """Method populates trie with the words and their frequencies, and the
+        deletion index with the words, from the English dictionary that only
+        contain English alphabets e.g. words with numbers are excluded.
         """
 
         words_frequencies_dictionary = json.load(open(self.file_name, 'r'))
@@ -48,6 +52,7 @@ class EnglishDictionary:
             word = str(key)
             if word.isalpha() is True:
                 self.trie.insert_nodes(word, value)
+                self.deletion_index.insert_word(word)
                 self.words_in_trie += 1
                 self.frequencies_in_trie += value
 
@@ -0,0 +1,67 @@
+class DeletionIndex:
+    """Class creates an index from every word, and every string generated by
+    deleting one character from the word, to the original words. It allows
+    finding the words one edit away from a given word with dictionary lookups
+    (symmetric delete algorithm)."""
+
+    def __init__(self):
+        """ Method initializes the empty deletion index.
+        """
+        self.words_for_deletion = {}
+
+    def generate_deletions(self, word):
+        """Method generates the given word and all the strings that are one
+        deleted character away from it.
+
+        Args:
+            word (string): A word from the dictionary, or typed by the user.
+
+        Returns:
+            Set: Method returns a set of strings including the word itself.
+        """
+        deletions = {word}
+        for i in range(len(word)):
+            deletions.add(word[:i] + word[i+1:])
+        return deletions
+
+    def insert_word(self, word):
+        """Method inserts one word in the deletion index.
+
+        Args:
+            word (string): Word to be added in the index.
+        """
+        for deletion in self.generate_deletions(word):
+            if deletion in self.words_for_deletion:
+                self.words_for_deletion[deletion].append(word)
+            else:
+                self.words_for_deletion[deletion] = [word]
+
+    def insert_multiple_words(self, given_list):
+        """Method inserts multiple words in the deletion index.
+
+        Args:
+            given_list (list): List of words given by application.
+        """
+        for word in given_list:
+            self.insert_word(word)
+
+    def search_candidate_words(self, word):
+        """Method searches for all the words in the index that share the word itself
+        or one of its one-deletion strings. The candidates include all the words one
+        deletion, insertion, substitution or transposition away, but also some
+        words further away, so they need to be verified by the caller.
+
+        Args:
+            word (string): A word typed by the user.
+
+        Returns:
+            Set: Method returns a set of candidate words.
+        """
+        candidate_words = set()
+        for deletion in self.generate_deletions(word):
+            if deletion in self.words_for_deletion:
+                candidate_words.update(self.words_for_deletion[deletion])
+        return candidate_words
+
+
+deletion_index = DeletionIndex()
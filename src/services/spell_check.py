@@ -1,10 +1,240 @@
 import string
 import re
+from collections import defaultdict
+from functools import lru_cache
 import numpy as np
 from repositories.trie import trie as default_trie
+from repositories.deletion_index import deletion_index as default_deletion_index
 from repositories.db_utilities import english_dictionary as default_english_dictionary
 from services.heuristics import distance_heuristics as default_distance_heuristics
 
+ALPHABET = tuple(string.ascii_lowercase)
+WORD_PATTERN = re.compile(r"[\w']+")
+
+VECTORIZED_WORD_LENGTH = 20
+
+
+def _distance_without_matrix(user_word, dictionary_word):
+    """Function returns the distance between two words, when it is known without
+    calculating the distance matrix: 0 for identical words, and the length of the
+    other word if one of the words is empty. Otherwise it returns None.
+
+    Args:
+        user_word (string): Word typed by user
+        dictionary_word (string): Word taken from dictionary
+    """
+    if user_word == dictionary_word:
+        return 0
+    if not user_word:
+        return len(dictionary_word)
+    if not dictionary_word:
+        return len(user_word)
+    return None
+
+
+def _levenshtein_distance(user_word, dictionary_word):
+    """Function calculates unweighted Levenshtein distance between two words.
+    Only two rows of the distance matrix are kept, and they are as long
+    as the shorter word.
+
+    Args:
+        user_word (string): Word typed by user
+        dictionary_word (string): Word taken from dictionary
+    """
+    shorter_word, longer_word = sorted((user_word, dictionary_word), key=len)
+    previous_row = list(range(len(shorter_word)+1))
+
+    for i, longer_character in enumerate(longer_word, 1):
+        current_row = [i]
+        for j, shorter_character in enumerate(shorter_word, 1):
+            current_row.append(min(previous_row[j]+1,
+                                   current_row[j-1]+1,
+                                   previous_row[j-1]+(longer_character != shorter_character)))
+        previous_row = current_row
+
+    return previous_row[-1]
+
+
+def _vectorized_levenshtein_distance(user_word, dictionary_word, previous_buffer,
+                                     current_buffer):
+    """Function calculates unweighted Levenshtein distance between two words with
+    numpy. Rows of the distance matrix are calculated over the longer word, one
+    row per character of the shorter word. Within a row, insertions are resolved
+    with a running minimum, so no loop over the columns is needed. The rows are
+    written in the given buffers, which are reused between calls.
+
+    Args:
+        user_word (string): Word typed by user
+        dictionary_word (string): Word taken from dictionary
+        previous_buffer (np.ndarray): Integer buffer at least one longer than the words
+        current_buffer (np.ndarray): Integer buffer at least one longer than the words
+    """
+    shorter_word, longer_word = sorted((user_word, dictionary_word), key=len)
+    longer_characters = np.fromiter(map(ord, longer_word), dtype=np.uint32,
+                                    count=len(longer_word))
+    row_length = len(longer_word)+1
+    columns = np.arange(row_length, dtype=previous_buffer.dtype)
+    previous_row = previous_buffer[:row_length]
+    current_row = current_buffer[:row_length]
+    previous_row[:] = columns
+
+    for i, shorter_character in enumerate(shorter_word, 1):
+        current_row[0] = i
+        np.add(previous_row[:-1], longer_characters != ord(shorter_character),
+               out=current_row[1:])
+        np.minimum(current_row[1:], previous_row[1:]+1, out=current_row[1:])
+        current_row -= columns
+        np.minimum.accumulate(current_row, out=current_row)
+        current_row += columns
+        previous_row, current_row = current_row, previous_row
+
+    return int(previous_row[-1])
+
+
+def _optimal_string_alignment_distance(user_word, dictionary_word):
+    """Function calculates unweighted optimal string alignment distance between two
+    words. Three rows of the distance matrix are kept, as transposition looks
+    two rows back.
+
+    Args:
+        user_word (string): Word typed by user
+        dictionary_word (string): Word taken from dictionary
+    """
+    shorter_word, longer_word = sorted((user_word, dictionary_word), key=len)
+    row_before_previous = []
+    previous_row = list(range(len(shorter_word)+1))
+
+    for i, longer_character in enumerate(longer_word, 1):
+        current_row = [i]
+        for j, shorter_character in enumerate(shorter_word, 1):
+            distance = min(previous_row[j]+1,
+                           current_row[j-1]+1,
+                           previous_row[j-1]+(longer_character != shorter_character))
+            if (i > 1 and j > 1 and longer_character == shorter_word[j-2]
+                    and longer_word[i-2] == shorter_character):
+                distance = min(distance, row_before_previous[j-2]+1)
+            current_row.append(distance)
+        row_before_previous = previous_row
+        previous_row = current_row
+
+    return previous_row[-1]
+
+
+def _generate_baseline_row_for_characters(user_codes, dictionary_codes):
+    """Function generates the structure that shows for each character code what was
+    the last row in the Damerau-Levenshtein distance matrix where it was present.
+    Row 1 is the first row of the matrix, and it marks characters that have not
+    been present yet. For ASCII words it is a list indexed by character code,
+    and otherwise a dictionary with row 1 as the default.
+
+    Args:
+        user_codes (list): Character codes of the word typed by user
+        dictionary_codes (list): Character codes of the word taken from dictionary
+    """
+    if max(user_codes, default=0) < 128 and max(dictionary_codes, default=0) < 128:
+        return [1]*128
+    return defaultdict(lambda: 1)
+
+
+def _optimal_string_alignment_distance_within(user_word, dictionary_word,
+                                              maximum_distance):
+    """Function calculates unweighted optimal string alignment distance between two
+    words, when only distances up to the given maximum matter. Only the diagonal
+    band of the distance matrix, where the distance can stay within the maximum,
+    is calculated, and the calculation stops as soon as a whole row exceeds it.
+
+    Args:
+        user_word (string): Word typed by user
+        dictionary_word (string): Word taken from dictionary
+        maximum_distance (int): Largest distance of interest
+
+    Returns:
+        Integer: Optimal string alignment distance, or maximum_distance+1 if the
+        distance is greater than the maximum.
+    """
+    exceeding_distance = maximum_distance+1
+    user_word_length = len(user_word)
+    dictionary_word_length = len(dictionary_word)
+    if abs(user_word_length-dictionary_word_length) > maximum_distance:
+        return exceeding_distance
+
+    row_before_previous = []
+    previous_row = [min(j, exceeding_distance)
+                    for j in range(dictionary_word_length+1)]
+
+    for i in range(1, user_word_length+1):
+        current_row = [exceeding_distance]*(dictionary_word_length+1)
+        current_row[0] = min(i, exceeding_distance)
+        row_minimum = current_row[0]
+        user_character = user_word[i-1]
+        for j in range(max(1, i-maximum_distance),
+                       min(dictionary_word_length, i+maximum_distance)+1):
+            distance = min(previous_row[j]+1,
+                           current_row[j-1]+1,
+                           previous_row[j-1]+(user_character != dictionary_word[j-1]),
+                           exceeding_distance)
+            if (i > 1 and j > 1 and user_character == dictionary_word[j-2]
+                    and user_word[i-2] == dictionary_word[j-1]):
+                distance = min(distance, row_before_previous[j-2]+1)
+            current_row[j] = distance
+            row_minimum = min(row_minimum, distance)
+        if row_minimum > maximum_distance:
+            return exceeding_distance
+        row_before_previous = previous_row
+        previous_row = current_row
+
+    return previous_row[-1]
+
+
+def _damerau_levenshtein_distance(user_word, dictionary_word):
+    """Function calculates unweighted Damerau-Levenshtein distance between two words.
+    The distance matrix is kept in one flat list, and the last row where each
+    character was present in the user word is looked up by character code, so
+    no numpy values are indexed or boxed per cell.
+
+    Args:
+        user_word (string): Word typed by user
+        dictionary_word (string): Word taken from dictionary
+    """
+    user_codes = [ord(character) for character in user_word]
+    dictionary_codes = [ord(character) for character in dictionary_word]
+    user_word_length = len(user_codes)
+    dictionary_word_length = len(dictionary_codes)
+    maximum_distance = user_word_length+dictionary_word_length
+    row_width = dictionary_word_length+2
+    distances = [maximum_distance]*((user_word_length+2)*row_width)
+    for i in range(1, user_word_length+2):
+        distances[i*row_width+1] = i-1
+    for j in range(1, row_width):
+        distances[row_width+j] = j-1
+    latest_row_for_character = _generate_baseline_row_for_characters(
+        user_codes, dictionary_codes)
+
+    for i in range(2, user_word_length+2):
+        row = i*row_width
+        previous_row = row-row_width
+        user_code = user_codes[i-2]
+        latest_column_for_character = 1
+        for j in range(2, row_width):
+            dictionary_code = dictionary_codes[j-2]
+            last_matching_row = latest_row_for_character[dictionary_code]
+            last_matching_column = latest_column_for_character
+            if user_code == dictionary_code:
+                distance_cost = 0
+                latest_column_for_character = j
+            else:
+                distance_cost = 1
+            transposition_distance = (
+                distances[(last_matching_row-1)*row_width+last_matching_column-1]
+                + (i-last_matching_row-1)+(j-last_matching_column-1)+1)
+            distances[row+j] = min(distances[previous_row+j-1]+distance_cost,
+                                   distances[row+j-1]+1,
+                                   distances[previous_row+j]+1,
+                                   transposition_distance)
+        latest_row_for_character[user_code] = i
+
+    return distances[-1]
+
 
 class SpellCheck:
     """Class provides core functionalities for spellchecking using different algorithms:
@@ -14,7 +244,8 @@ class SpellCheck:
     """
 
     def __init__(self, trie=default_trie, dictionary=default_english_dictionary,
-                 distance_heuristics=default_distance_heuristics):
+                 distance_heuristics=default_distance_heuristics,
+                 deletion_index=default_deletion_index):
         """Method initializes the spell checker, the related trie
             data structure, and the English dictionary.
 
@@ -23,11 +254,27 @@ class SpellCheck:
                 words. Defaults to default_trie.
                 dictionary (Class, optional): Class opens data file with English
                 dictionary and populates the trie structure. Defaults to default_english_dictionary.
+                deletion_index (Class, optional): Deletion index populated with English
+                words. Defaults to default_deletion_index.
+
+            Word checks and one-edit alternatives are cached by the lowercased word.
+            The trie and the deletion index must therefore be fully populated before
+            the spell checker is initialized, as words inserted later are not seen
+            for cached words.
         """
 
         self.trie = trie
+        self.deletion_index = deletion_index
         self.dictionary = dictionary
         self.distance_heuristics = distance_heuristics
+        self._previous_row = np.empty(128, dtype=np.int16)
+        self._current_row = np.empty(128, dtype=np.int16)
+        self._cached_user_input_as_list = lru_cache(maxsize=1024)(
+            self._split_user_input)
+        self._cached_is_word_english = lru_cache(maxsize=8192)(
+            self.trie.search_if_word_in_trie)
+        self._cached_alternative_words_in_english = lru_cache(maxsize=8192)(
+            self._search_alternative_words_in_english)
 
     def word_contains_only_english_characters(self, user_input):
         """Method checks if the word contains only English characters.
@@ -62,19 +309,31 @@ class SpellCheck:
         original_user_input_as_list = user_input.split()
         return original_user_input_as_list
 
+    def _split_user_input(self, user_input):
+        """Method splits given user input into a tuple of strings in lower case
+        at empty spaces and different punctuation marks.
+
+        Args:
+             user_input (string): Input is one or multiple words in string format.
+        """
+
+        return tuple(WORD_PATTERN.findall(user_input.lower()))
+
     def convert_user_input_as_list(self, user_input):
         """Method converts given user input into a list of strings in lower case,
         splitting the user input to words at empty spaces and different punctuation marks.
+        Results are cached for recently given inputs.
 
         Args:
              user_input (string): Input is one or multiple words in string format.
         """
 
-        user_input_as_list = re.findall(r"[\w']+", user_input.lower())
+        user_input_as_list = list(self._cached_user_input_as_list(user_input))
         return user_input_as_list
 
     def is_word_english(self, test_word):
-        """Method returns whether the given word is English or not.
+        """Method returns whether the given word is English or not. The word is
+        lowercased, and results are cached for recently checked words.
 
            Args:
                 test_word (string): Word input by user (string).
@@ -82,7 +341,7 @@ class SpellCheck:
                 Boolean: Method returns whether the given word is English (True) or not (False).
         """
 
-        return self.trie.search_if_word_in_trie(test_word)
+        return self._cached_is_word_english(test_word.lower())
 
     def alternative_words_with_one_distance(self, test_word):
         """For a given input_word, the method generates all the alternative words that
@@ -92,48 +351,61 @@ class SpellCheck:
             input_word (string): A word written by the user (string).
         """
 
-        alternative_words_generated = ""
-        alternative_letters = "abcdefghijklmnopqrstuvwxyz"
-        split_test_word = [(test_word[:i], test_word[i:])
-                           for i in range(len(test_word) + 1)]
-        deleting_characters = [split_left + split_right[1:]
-                               for split_left, split_right in split_test_word if split_right]
-        transposing_characters_in_split_words = [split_left + split_right[1] + split_right[0] +
-                                                 split_right[2:] for split_left,
-                                                 split_right in split_test_word
-                                                 if len(split_right) > 1]
-        replacing_characters_in_split_words = [split_left + character + split_right[1:]
-                                               for split_left, split_right
-                                               in split_test_word
-                                               if split_right for character in alternative_letters]
-        insert_characters_in_split_words = [split_left + character + split_right for split_left,
-                                            split_right in split_test_word for character
-                                            in alternative_letters]
-
-        alternative_words_generated = set(deleting_characters +
-                                          transposing_characters_in_split_words +
-                                          replacing_characters_in_split_words +
-                                          insert_characters_in_split_words)
+        test_word_length = len(test_word)
+        alternative_words_generated = set()
+
+        for i in range(test_word_length):
+            split_left = test_word[:i]
+            split_right = test_word[i+1:]
+            alternative_words_generated.add(split_left + split_right)
+            if i < test_word_length-1:
+                alternative_words_generated.add(
+                    split_left + test_word[i+1] + test_word[i] + test_word[i+2:])
+            for character in ALPHABET:
+                alternative_words_generated.add(
+                    split_left + character + split_right)
+                alternative_words_generated.add(
+                    split_left + character + test_word[i:])
+
+        for character in ALPHABET:
+            alternative_words_generated.add(test_word + character)
 
         return alternative_words_generated
 
-    def alternative_words_in_english(self, test_word):
-        """Method generates alternative words, and returns which ones of them are English.
+    def _search_alternative_words_in_english(self, test_word):
+        """Method looks up English words that are one deletion, insertion,
+        substitution or transposition away from the given word from the
+        deletion index, and keeps the ones within one optimal string
+        alignment distance.
 
             Args:
                 test_word (string): A word written by the user (string).
 
             Returns:
-                List: Method returns a list of alternative English words
+                Tuple: Method returns a tuple of alternative English words
         """
-        all_alternative_words = self.alternative_words_with_one_distance(
-            test_word)
         alternative_english_words = []
 
-        for word in all_alternative_words:
-            if self.trie.search_if_word_in_trie(word) is True:
+        for word in self.deletion_index.search_candidate_words(test_word):
+            if _optimal_string_alignment_distance_within(test_word, word, 1) <= 1:
                 alternative_english_words.append(word)
 
+        return tuple(alternative_english_words)
+
+    def alternative_words_in_english(self, test_word):
+        """Method returns English words that are one deletion, insertion,
+        substitution or transposition away from the given word. The word is
+        lowercased, and results are cached for recently checked words.
+
+            Args:
+                test_word (string): A word written by the user (string).
+
+            Returns:
+                List: Method returns a list of alternative English words
+        """
+        alternative_english_words = list(
+            self._cached_alternative_words_in_english(test_word.lower()))
+
         return alternative_english_words
 
     def generate_matrix(self, user_word_length, dictionary_word_length):
@@ -144,16 +416,10 @@ class SpellCheck:
             user_word_length (int): Length of the word typed by user
             dictionary_word_length (int): Length of the word taken from dictionary
         """
-        baseline_matrix = np.full(
-            (user_word_length, dictionary_word_length), float(
-                user_word_length+dictionary_word_length))
-        first_column = np.arange(1, user_word_length+1, 1)
-        first_column = first_column.reshape(-1, 1)
-        first_row = np.arange(0, dictionary_word_length+1, 1)
-        first_row = first_row.reshape(-1, 1)
-        first_row = first_row.T
-        matrix = np.append(first_column, baseline_matrix, axis=1)
-        matrix = np.append(first_row, matrix, axis=0)
+        matrix = np.empty((user_word_length+1, dictionary_word_length+1))
+        matrix[0] = np.arange(dictionary_word_length+1)
+        matrix[:, 0] = np.arange(user_word_length+1)
+        matrix[1:, 1:] = user_word_length+dictionary_word_length
 
         return matrix
 
@@ -166,103 +432,145 @@ class SpellCheck:
             dictionary_word_length (int): Length of the word taken from dictionary
         """
 
-        baseline_matrix = np.full(
-            (user_word_length+2, dictionary_word_length+2), float(
-                user_word_length+dictionary_word_length))
-        for i in range(1, user_word_length+2):
-            baseline_matrix[i][1] = i-1
-        for j in range(1, dictionary_word_length+2):
-            baseline_matrix[1][j] = j-1
+        maximum_distance = user_word_length+dictionary_word_length
+        baseline_matrix = np.empty((user_word_length+2, dictionary_word_length+2))
+        baseline_matrix[0] = maximum_distance
+        baseline_matrix[:, 0] = maximum_distance
+        baseline_matrix[1:, 1] = np.arange(user_word_length+1)
+        baseline_matrix[1, 1:] = np.arange(dictionary_word_length+1)
+        baseline_matrix[2:, 2:] = maximum_distance
 
         return baseline_matrix
 
-    def cost_heuristic_for_characters(self, character_1, character_2, weighting=False):
-        """Method returns heuristic to estimate the distance between
-        two characters.
-
-        Args:
-            character_1 (string): One character
-            character_2 (string): Another character
-        """
-
-        if weighting is False:
-            return self.distance_heuristics.distance_heuristic_always_the_same(character_1,
-                                                                               character_2)
-        elif weighting is True:
-            return self.distance_heuristics.calculate_distance_heuristic_for_characters_keyboard_only(
-                character_1, character_2)
-
-    def calculate_levenshtein_distance(self, user_word, dictionary_word, weighting_used=False):
-        """Method calculates Levenshtein distance between two words, which allows
-        insertions, deletions, and symbol substitutions to transform from
-        user word to dictionary word. Full matrix is used for illustrative purposes.
+    def calculate_weighted_matrix_distance(self, user_word, dictionary_word,
+                                           transposition_allowed):
+        """Method calculates weighted Levenshtein distance, or optimal string alignment
+        distance if transposition is allowed, between two words. Substitution costs
+        come from the keyboard distance heuristic. Full matrix is used for
+        illustrative purposes.
 
         Args:
             user_word (string): Word typed by user
             dictionary_word (string): Word taken from dictionary
+            transposition_allowed (bool): True for optimal string alignment distance,
+            False for Levenshtein distance.
         """
         distance_matrix = self.generate_matrix(
             len(user_word), len(dictionary_word))
+        keyboard_heuristic = (self.distance_heuristics
+                              .calculate_distance_heuristic_for_characters_keyboard_only)
 
         for i in range(1, len(user_word)+1):
             for j in range(1, len(dictionary_word)+1):
-                distance = self.cost_heuristic_for_characters(
-                    user_word[i-1], dictionary_word[j-1], weighting_used)
+                if user_word[i-1] == dictionary_word[j-1]:
+                    distance = 0
+                else:
+                    distance = keyboard_heuristic(
+                        user_word[i-1], dictionary_word[j-1])
                 distance_matrix[i][j] = min((distance_matrix[i-1][j]+1),
                                             (distance_matrix[i][j-1]+1),
                                             (distance_matrix[i-1][j-1]+distance))
 
+                if (transposition_allowed and (i > 1) and (j > 1)
+                        and (user_word[i-1] == dictionary_word[j-2])
+                        and (user_word[i-2] == dictionary_word[j-1])):
+                    distance_matrix[i, j] = min(
+                        distance_matrix[i][j], distance_matrix[i-2][j-2]+1)
+
         shortest_distance = distance_matrix[len(
             user_word), len(dictionary_word)]
 
         return shortest_distance
 
-    def calculate_optimal_string_alignment_distance(self, user_word, dictionary_word,
-                                                    weighting_used=False):
-        """Method calculates optimal string alignment distance between two words, which allows
+    def calculate_levenshtein_distance(self, user_word, dictionary_word, weighting_used=False):
+        """Method calculates Levenshtein distance between two words, which allows
         insertions, deletions, and symbol substitutions to transform from
-        user word to dictionary word as well as transposition.
-        It does not allow for multiple transformation on the same substring.
-        Full matrix is used for illustrative purposes.
+        user word to dictionary word. Without weighting, the distance is calculated
+        with two rolling rows, or with numpy rows for long words. With weighting,
+        the weighted matrix distance is used.
 
         Args:
             user_word (string): Word typed by user
             dictionary_word (string): Word taken from dictionary
         """
+        known_distance = _distance_without_matrix(user_word, dictionary_word)
+        if known_distance is not None:
+            return float(known_distance) if weighting_used else known_distance
+        if weighting_used is False:
+            if min(len(user_word), len(dictionary_word)) >= VECTORIZED_WORD_LENGTH:
+                # The kernel indexes the rows by characters, so the buffers are
+                # sized by the character count of the longer word.
+                row_length = max(len(user_word), len(dictionary_word))+1
+                if row_length > len(self._previous_row):
+                    self._previous_row = np.empty(row_length, dtype=np.int16)
+                    self._current_row = np.empty(row_length, dtype=np.int16)
+                return _vectorized_levenshtein_distance(user_word, dictionary_word,
+                                                        self._previous_row,
+                                                        self._current_row)
+            return _levenshtein_distance(user_word, dictionary_word)
+
+        return self.calculate_weighted_matrix_distance(user_word, dictionary_word, False)
+
+    def calculate_levenshtein_distances(self, user_word, dictionary_words):
+        """Method calculates unweighted Levenshtein distance between one word and
+        many dictionary words at once. The dictionary words are stacked as rows
+        of a character code matrix, padded to the same length, and each row of
+        the distance matrix is calculated for all of them with numpy.
 
-        distance_matrix = self.generate_matrix(
-            len(user_word), len(dictionary_word))
-
-        for i in range(1, len(user_word)+1):
-            for j in range(1, len(dictionary_word)+1):
-                distance = self.cost_heuristic_for_characters(
-                    user_word[i-1], dictionary_word[j-1], weighting_used)
-                distance_matrix[i][j] = min((distance_matrix[i-1][j]+1),
-                                            (distance_matrix[i][j-1]+1),
-                                            (distance_matrix[i-1][j-1]+distance))
-
-                if (i > 1) and (j > 1) and (user_word[i-1] == dictionary_word[j-2]) and (user_word[i-2] == dictionary_word[j-1]):
-                    distance_matrix[i, j] = min(
-                        distance_matrix[i][j], distance_matrix[i-2][j-2]+1)
+        Args:
+            user_word (string): Word typed by user
+            dictionary_words (list): Words taken from dictionary
 
-        shortest_distance = distance_matrix[len(
-            user_word), len(dictionary_word)]
+        Returns:
+            List: Method returns the distances in the order of the dictionary words.
+        """
+        if not dictionary_words:
+            return []
+
+        longest_length = max(max(len(word) for word in dictionary_words), 1)
+        dictionary_characters = np.array(
+            dictionary_words, dtype=f"<U{longest_length}").view(np.uint32).reshape(
+                len(dictionary_words), longest_length)
+        dictionary_word_lengths = np.array(
+            [len(word) for word in dictionary_words])
+        columns = np.arange(longest_length+1, dtype=np.int16)
+        previous_rows = np.tile(columns, (len(dictionary_words), 1))
+        current_rows = np.empty_like(previous_rows)
+
+        for i, user_character in enumerate(user_word, 1):
+            current_rows[:, 0] = i
+            np.add(previous_rows[:, :-1], dictionary_characters != ord(user_character),
+                   out=current_rows[:, 1:])
+            np.minimum(current_rows[:, 1:], previous_rows[:, 1:]+1,
+                       out=current_rows[:, 1:])
+            current_rows -= columns
+            np.minimum.accumulate(current_rows, axis=1, out=current_rows)
+            current_rows += columns
+            previous_rows, current_rows = current_rows, previous_rows
+
+        return previous_rows[np.arange(len(dictionary_words)),
+                             dictionary_word_lengths].tolist()
 
-        return shortest_distance
+    def calculate_optimal_string_alignment_distance(self, user_word, dictionary_word,
+                                                    weighting_used=False):
+        """Method calculates optimal string alignment distance between two words, which allows
+        insertions, deletions, and symbol substitutions to transform from
+        user word to dictionary word as well as transposition.
+        It does not allow for multiple transformation on the same substring.
+        Without weighting, the distance is calculated with rolling rows.
+        With weighting, the weighted matrix distance is used.
 
-    def generate_baseline_row_for_characters(self):
-        """Method generates a dictionary that shows for each English character,
-        and one symbol ("_") what was the last row in the Damerau-Levenhstein distance
-        matrix where it was present.
+        Args:
+            user_word (string): Word typed by user
+            dictionary_word (string): Word taken from dictionary
         """
+        known_distance = _distance_without_matrix(user_word, dictionary_word)
+        if known_distance is not None:
+            return float(known_distance) if weighting_used else known_distance
+        if weighting_used is False:
+            return _optimal_string_alignment_distance(user_word, dictionary_word)
 
-        baseline_row_for_characters = {}
-        characters = string.ascii_lowercase
-        for char in characters:
-            baseline_row_for_characters[char] = 0
-        baseline_row_for_characters["_"] = 0
-
-        return baseline_row_for_characters
+        return self.calculate_weighted_matrix_distance(user_word, dictionary_word, True)
 
     def calculate_damerau_levenshtein_distance(self, user_word, dictionary_word,
                                                weighting_used=False):
@@ -270,29 +578,41 @@ class SpellCheck:
         insertions, deletions, and symbol substitutions to transform from
         user word to dictionary word as well as transposition.
         It also allows for multiple transformation on the same substring.
-        Full matrix is used for illustrative purposes.
+        Without weighting, the matrix is kept in a flat list. With weighting,
+        full matrix is used for illustrative purposes.
 
         Args:
             user_word (string): Word typed by user
             dictionary_word (string): Word taken from dictionary
         """
 
+        known_distance = _distance_without_matrix(user_word, dictionary_word)
+        if known_distance is not None:
+            return float(known_distance) if weighting_used else known_distance
+        if weighting_used is False:
+            return _damerau_levenshtein_distance(user_word, dictionary_word)
+
         distance_matrix = self.generate_damerau_leven_matrix(
             len(user_word), len(dictionary_word))
-        latest_row_for_character = self.generate_baseline_row_for_characters()
+        user_codes = [ord(character) for character in user_word]
+        dictionary_codes = [ord(character) for character in dictionary_word]
+        latest_row_for_character = _generate_baseline_row_for_characters(
+            user_codes, dictionary_codes)
+        keyboard_heuristic = (self.distance_heuristics
+                              .calculate_distance_heuristic_for_characters_keyboard_only)
 
         for i in range(2, len(user_word)+2):
-            latest_column_for_character = 0
+            latest_column_for_character = 1
             for j in range(2, len(dictionary_word)+2):
-                last_matching_row = latest_row_for_character[dictionary_word[j-2]]
+                last_matching_row = latest_row_for_character[dictionary_codes[j-2]]
                 last_matching_column = latest_column_for_character
 
                 if user_word[i-2] == dictionary_word[j-2]:
                     distance_cost = 0
                     latest_column_for_character = j
                 else:
-                    distance_cost = self.cost_heuristic_for_characters(
-                        user_word[i-2], dictionary_word[j-2], weighting_used)
+                    distance_cost = keyboard_heuristic(
+                        user_word[i-2], dictionary_word[j-2])
 
                 distance_matrix[i][j] = min(distance_matrix[i-1][j-1]+distance_cost,
                                             distance_matrix[i][j-1]+1,
@@ -301,7 +621,7 @@ class SpellCheck:
                                             + (i-last_matching_row-1)+(j-last_matching_column-1)+1)
                                             )
 
-            latest_row_for_character[user_word[i-2]] = i
+            latest_row_for_character[user_codes[i-2]] = i
 
         return distance_matrix[-1][-1]
 
@@ -323,6 +643,13 @@ class SpellCheck:
         alternatives_from_dictionary = self.trie.get_all_words(
             True, len(given_user_word))
 
+        if indicator_for_metric == 1 and weighting_used is False:
+            distances = self.calculate_levenshtein_distances(
+                given_user_word, [item[1] for item in alternatives_from_dictionary])
+            for item, distance in zip(alternatives_from_dictionary, distances):
+                suggestions.append((item[1], distance, item[2]))
+            return self.select_top_suggestions(suggestions)
+
         for item in alternatives_from_dictionary:
             dictionary_word = item[1]
             if indicator_for_metric == 1:
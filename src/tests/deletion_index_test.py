@@ -0,0 +1,32 @@
+import unittest
+from repositories.deletion_index import DeletionIndex
+
+
+class TestDeletionIndex(unittest.TestCase):
+    def setUp(self):
+        self.test_deletion_index = DeletionIndex()
+
+    def test_generate_deletions(self):
+        output = self.test_deletion_index.generate_deletions("able")
+        wanted_answer = {"able", "ble", "ale", "abe", "abl"}
+        self.assertEqual(output, wanted_answer)
+
+    def test_insert_word(self):
+        self.test_deletion_index.insert_word("ab")
+        output = self.test_deletion_index.words_for_deletion
+        wanted_answer = {"ab": ["ab"], "a": ["ab"], "b": ["ab"]}
+        self.assertEqual(output, wanted_answer)
+
+    def test_search_candidate_words_found(self):
+        word_list = ["abandon", "ability", "able", "about", "ab", "bale",
+                     "cable", "abe", "tables"]
+        self.test_deletion_index.insert_multiple_words(word_list)
+        output = self.test_deletion_index.search_candidate_words("albe")
+        wanted_answer = {"abe", "able", "bale"}
+        self.assertEqual(output, wanted_answer)
+
+    def test_search_candidate_words_not_found(self):
+        word_list = ["abandon", "ability", "able", "about", "ab"]
+        self.test_deletion_index.insert_multiple_words(word_list)
+        output = self.test_deletion_index.search_candidate_words("nomimono")
+        self.assertEqual(output, set())
@@ -43,6 +43,11 @@ class TestSpellCheck(unittest.TestCase):
         output = self.check_spelling.is_word_english(user_input)
         self.assertTrue(output)
 
+    def test_is_word_english_upper_case(self):
+        user_input = "Mom"
+        output = self.check_spelling.is_word_english(user_input)
+        self.assertTrue(output)
+
     def test_is_word_english_false(self):
         user_input = "nomimono"
         output = self.check_spelling.is_word_english(user_input)
@@ -63,6 +68,31 @@ class TestSpellCheck(unittest.TestCase):
             ['forest', 'fret', 'fore', 'fort', 'forget', 'floret', 'forte'])
         self.assertEqual(output, wanted_answer)
 
+    def test_generate_matrix(self):
+        output = self.check_spelling.generate_matrix(2, 3).tolist()
+        wanted_answer = [[0, 1, 2, 3], [1, 5, 5, 5], [2, 5, 5, 5]]
+        self.assertEqual(output, wanted_answer)
+
+    def test_generate_damerau_leven_matrix(self):
+        output = self.check_spelling.generate_damerau_leven_matrix(
+            1, 2).tolist()
+        wanted_answer = [[3, 3, 3, 3], [3, 0, 1, 2], [3, 1, 3, 3]]
+        self.assertEqual(output, wanted_answer)
+
+    def test_alternative_words_in_english_cached_result_not_changed(self):
+        user_input = "foret"
+        first_output = self.check_spelling.alternative_words_in_english(
+            user_input)
+        first_output.clear()
+        output = self.check_spelling.alternative_words_in_english(user_input)
+        self.assertEqual(len(output), 7)
+
+    def test_alternative_words_in_english_upper_case(self):
+        output = sorted(self.check_spelling.alternative_words_in_english("FORET"))
+        wanted_answer = sorted(
+            self.check_spelling.alternative_words_in_english("foret"))
+        self.assertEqual(output, wanted_answer)
+
     def test_calculate_levenshtein_distance_words_same_length(self):
         test_user_word = "intention"
         test_dictionary_word = "execution"
@@ -79,6 +109,51 @@ class TestSpellCheck(unittest.TestCase):
         wanted_answer = 3
         self.assertEqual(output, wanted_answer)
 
+    def test_calculate_levenshtein_distance_longer_user_word(self):
+        test_user_word = "saturday"
+        test_dictionary_word = "sunday"
+        output = self.check_spelling.calculate_levenshtein_distance(
+            test_user_word, test_dictionary_word)
+        wanted_answer = 3
+        self.assertEqual(output, wanted_answer)
+
+    def test_calculate_levenshtein_distance_long_words(self):
+        test_user_word = "pneumonoultramicroscopicsilicovolcanokoniosis"
+        test_dictionary_word = "pneumonoultramicroscopicsilicovolcanoconiosis"
+        output = self.check_spelling.calculate_levenshtein_distance(
+            test_user_word, test_dictionary_word)
+        wanted_answer = 1
+        self.assertEqual(output, wanted_answer)
+
+    def test_calculate_levenshtein_distances(self):
+        test_user_word = "sunday"
+        test_dictionary_words = ["saturday", "sunday", "monday", "sun"]
+        output = self.check_spelling.calculate_levenshtein_distances(
+            test_user_word, test_dictionary_words)
+        wanted_answer = [3, 0, 2, 3]
+        self.assertEqual(output, wanted_answer)
+
+    def test_calculate_levenshtein_distances_same_as_one_word(self):
+        test_user_word = "café"
+        test_dictionary_words = ["cafe", "cafés", "face"]
+        output = self.check_spelling.calculate_levenshtein_distances(
+            test_user_word, test_dictionary_words)
+        wanted_answer = [self.check_spelling.calculate_levenshtein_distance(
+            test_user_word, word) for word in test_dictionary_words]
+        self.assertEqual(output, wanted_answer)
+
+    def test_calculate_distances_non_english_characters(self):
+        output = [self.check_spelling.calculate_levenshtein_distance("café", "cafe"),
+                  self.check_spelling.calculate_optimal_string_alignment_distance(
+                      "mäm", "mam")]
+        self.assertEqual(output, [1, 1])
+
+    def test_calculate_levenshtein_distance_non_english_words_longer_than_buffer(self):
+        output = self.check_spelling.calculate_levenshtein_distance(
+            "é"*200, "a"*200)
+        wanted_answer = 200
+        self.assertEqual(output, wanted_answer)
+
     def test_calculate_optimal_string_alignment_distance(self):
         test_user_word = "a_cat"
         test_dictionary_word = "an_act"
@@ -95,6 +170,27 @@ class TestSpellCheck(unittest.TestCase):
         wanted_answer = 2
         self.assertEqual(output, wanted_answer)
 
+    def test_calculate_damerau_levenshtein_distance_long_words(self):
+        test_user_word = "pneumonoultramicroscopicsilicovolcanoconiosis"
+        test_dictionary_word = "pneumonoultramicroscopicsilicovolcanokoniosis"
+        output = self.check_spelling.calculate_damerau_levenshtein_distance(
+            test_user_word, test_dictionary_word)
+        wanted_answer = 1
+        self.assertEqual(output, wanted_answer)
+
+    def test_calculate_damerau_levenshtein_distance_longer_than_dictionary_word(self):
+        test_user_word = "caccacaa"
+        test_dictionary_word = "ca"
+        output = self.check_spelling.calculate_damerau_levenshtein_distance(
+            test_user_word, test_dictionary_word)
+        wanted_answer = 6
+        self.assertEqual(output, wanted_answer)
+
+    def test_calculate_damerau_levenshtein_distance_non_english_characters(self):
+        output = [self.check_spelling.calculate_damerau_levenshtein_distance("mäm", "mam"),
+                  self.check_spelling.calculate_damerau_levenshtein_distance("äbc", "bäc")]
+        self.assertEqual(output, [1, 1])
+
     def test_generate_damerau_levenshtein_distance_differs_optimal_string(self):
         test_user_word = "ca"
         test_dictionary_word = "abc"
@@ -104,6 +200,29 @@ class TestSpellCheck(unittest.TestCase):
             test_user_word, test_dictionary_word)
         self.assertEqual((output_osa, output_dl), (3, 2))
 
+    def test_calculate_distances_same_words(self):
+        test_word = "house"
+        output = [self.check_spelling.calculate_levenshtein_distance(test_word, test_word, True),
+                  self.check_spelling.calculate_optimal_string_alignment_distance(
+                      test_word, test_word),
+                  self.check_spelling.calculate_damerau_levenshtein_distance(test_word, test_word)]
+        self.assertEqual(output, [0, 0, 0])
+
+    def test_calculate_distances_empty_word(self):
+        output = [self.check_spelling.calculate_levenshtein_distance("", "house"),
+                  self.check_spelling.calculate_optimal_string_alignment_distance(
+                      "house", "", True),
+                  self.check_spelling.calculate_damerau_levenshtein_distance("", "house")]
+        self.assertEqual(output, [5, 5, 5])
+
+    def test_calculate_distances_known_distance_weighting_used_is_float(self):
+        output = [self.check_spelling.calculate_levenshtein_distance("house", "house", True),
+                  self.check_spelling.calculate_optimal_string_alignment_distance(
+                      "", "house", True),
+                  self.check_spelling.calculate_damerau_levenshtein_distance(
+                      "house", "", True)]
+        self.assertTrue(all(isinstance(distance, float) for distance in output))
+
     def test_calculate_levenshtein_distance_weighting_used(self):
         test_user_word_1 = "hiuse"
         test_user_word_2 = "hquse"